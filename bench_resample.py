@@ -0,0 +1,59 @@
+"""Benchmark ``utils.resample`` against the per-row ``to_period(...).apply(lambda)`` bucketing it replaced.
+
+Builds a multi-year daily series for every platform chart URL in the registry
+(the shape of the Platforms page input), checks that both implementations give
+the same result and prints their timings::
+
+    python bench_resample.py [years]
+"""
+
+import sys
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from utils import resample
+from utils.platforms import platform_urls
+
+FREQS = {"week": "W", "month": "M"}
+
+
+def sample(years):
+    days = pd.date_range(end="2025-07-31", periods=365 * years, freq="D")
+    rng = np.random.default_rng(0)
+    frames = [
+        pd.DataFrame({
+            "timestamp": days,
+            "num_txs": rng.integers(0, 1000, len(days)),
+            "volume": rng.random(len(days)) * 1e6,
+            "platform": platform,
+        })
+        for platform, urls in platform_urls("GMPChart", "transfersChart").items()
+        for _ in urls
+    ]
+    return pd.concat(frames, ignore_index=True)
+
+
+def per_row(df, timeframe):
+    df = df.copy()
+    df["period"] = df["timestamp"].dt.to_period(FREQS[timeframe]).apply(lambda r: r.start_time)
+    return df.groupby(["period", "platform"]).agg(
+        num_txs=("num_txs", "sum"),
+        volume=("volume", "sum"),
+    ).reset_index()
+
+
+def vectorized(df, timeframe):
+    return resample.aggregate(df, timeframe, by=["platform"], columns=["num_txs", "volume"])
+
+
+if __name__ == "__main__":
+    years = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    df = sample(years)
+    print(f"{len(df):,} daily rows ({years} years x {df['platform'].nunique()} platforms)")
+    for timeframe in FREQS:
+        pd.testing.assert_frame_equal(per_row(df, timeframe), vectorized(df, timeframe), check_dtype=False)
+        old = min(timeit.repeat(lambda: per_row(df, timeframe), number=1, repeat=5))
+        new = min(timeit.repeat(lambda: vectorized(df, timeframe), number=1, repeat=5))
+        print(f"{timeframe:>5}: per-row {old * 1000:8.1f} ms   vectorized {new * 1000:8.1f} ms   {old / new:5.1f}x")
@@ -0,0 +1,18 @@
+"""Incrementally sync the local Parquet mirror of the Axelar fact tables, rebuild the daily rollup
+and extend the first-seen user index.
+
+Run from the repository root (so ``.streamlit/secrets.toml`` is found), e.g.
+from cron once a day::
+
+    python sync_mirror.py
+"""
+
+from utils import first_seen, rollup
+from utils.mirror import MIRROR_DIR, sync
+
+if __name__ == "__main__":
+    for table, rows in sync().items():
+        print(f"{table}: {rows:,} rows synced into {MIRROR_DIR / table}")
+    for file, rows in rollup.build().items():
+        print(f"{file}: {rows:,} rows written to {rollup.ROLLUP_DIR}")
+    print(f"{first_seen.update():,} new users indexed into {rollup.ROLLUP_DIR / first_seen.INDEX_FILE}")
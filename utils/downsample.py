@@ -0,0 +1,68 @@
+"""Shape-preserving downsampling of long line series.
+
+A day-level line over several years has far more points than its chart has
+horizontal pixels. ``lttb`` (Largest-Triangle-Three-Buckets) keeps, from each
+bucket of consecutive points, the one forming the largest triangle with its
+kept neighbours, so peaks and turns survive while the payload shrinks to about
+one point per pixel. ``render_mode`` switches Plotly Express to WebGL traces
+once a chart still has many points.
+"""
+
+import numpy as np
+import pandas as pd
+
+# -- Points kept per trace: about one per horizontal pixel of a half-width chart
+PIXEL_BUDGET = 600
+# -- Points per figure above which SVG traces get slow in the browser
+WEBGL_POINTS = 5000
+
+
+def _numeric(values):
+    values = pd.Series(values)
+    if pd.api.types.is_datetime64_any_dtype(values):
+        values = values.astype("int64")
+    return values.to_numpy(dtype="float64")
+
+
+def lttb(x, y, threshold):
+    """Positions of the ``threshold`` points of the ``(x, y)`` line that LTTB keeps.
+
+    ``x`` must be sorted. The first and last points are always kept; series
+    that already fit are returned whole.
+    """
+    n = len(y)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    x, y = _numeric(x), _numeric(y)
+    # -- threshold - 2 buckets over the inner points; spacing >= 1 keeps every bucket non-empty
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+    keep = np.empty(threshold, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for i in range(threshold - 2):
+        lo, hi = edges[i], edges[i + 1]
+        next_hi = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x, avg_y = x[hi:next_hi].mean(), y[hi:next_hi].mean()
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = lo + int(area.argmax())
+        keep[i + 1] = a
+    return keep
+
+
+def exceeds_budget(df, by, budget=PIXEL_BUDGET):
+    """Whether any ``by`` series of ``df`` has more points than ``budget``."""
+    return not df.empty and df.groupby(by).size().max() > budget
+
+
+def downsample(df, x, y, by, budget=PIXEL_BUDGET):
+    """Rows of ``df`` that LTTB keeps for the ``y`` against ``x`` line of each ``by`` series."""
+    kept = []
+    for _, series in df.groupby(by, sort=False):
+        series = series.sort_values(x)
+        kept.append(series.index[lttb(series[x], series[y], budget)])
+    return df[df.index.isin(np.concatenate(kept))] if kept else df
+
+
+def render_mode(points):
+    """Plotly Express ``render_mode`` for a figure with ``points`` markers."""
+    return "webgl" if points > WEBGL_POINTS else "svg"
@@ -0,0 +1,181 @@
+"""Pluggable execution backend for the dashboard SQL.
+
+``run_query`` runs a page's Snowflake SQL in-process on DuckDB over the local
+Parquet mirror (see ``utils.mirror``) when the mirror covers the requested
+range, and falls back to Snowflake for cold or out-of-snapshot ranges and for
+anything DuckDB cannot bind.
+
+The mirror is exposed to DuckDB as ``fact_transfers`` / ``fact_gmp`` views
+whose ``data`` column is a STRUCT rebuilt from the flattened mirror columns,
+so VARIANT paths such as ``data:send:amount`` translate to plain struct field
+access. Paths the mirror does not carry fail to bind and go to Snowflake.
+
+``AXELAR_ENGINE`` selects the backend: ``auto`` (default), ``duckdb`` (offline
+mode, never touches Snowflake) or ``snowflake``.
+"""
+
+import os
+import re
+import threading
+
+import duckdb
+import pandas as pd
+import streamlit as st
+
+from utils import mirror
+from utils.db import iter_sql, read_sql
+from utils.sql import bind
+
+ENGINE = os.environ.get("AXELAR_ENGINE", "auto")
+# -- Rows per batch when streaming a DuckDB result
+STREAM_BATCH_ROWS = 5000
+
+_VIEWS = {
+    "fact_transfers": """
+        SELECT created_at, id, status, simplified_status, sender_address, recipient_address,
+               {{
+                   'send': {{
+                       'amount': amount,
+                       'fee_value': fee,
+                       'original_source_chain': source_chain,
+                       'original_destination_chain': destination_chain
+                   }},
+                   'link': {{'price': price, 'asset': asset}}
+               }} AS data
+        FROM read_parquet('{path}')
+    """,
+    "fact_gmp": """
+        SELECT created_at, id, status, simplified_status,
+               {{
+                   'call': {{
+                       'chain': source_chain,
+                       'returnValues': {{'destinationChain': destination_chain}},
+                       'transaction': {{'from': sender_address}}
+                   }},
+                   'approved': {{'returnValues': {{'contractAddress': contract_address}}}},
+                   'amount': amount,
+                   'value': amount_usd,
+                   'symbol': asset,
+                   'gas': {{'gas_used_amount': gas_used_amount}},
+                   'gas_price_rate': {{'source_token': {{'token_price': {{'usd': gas_token_price_usd}}}}}},
+                   'fees': {{'express_fee_usd': express_fee_usd}}
+               }} AS data
+        FROM read_parquet('{path}')
+    """,
+}
+
+# -- Snowflake functions the dashboard uses, as DuckDB macros
+_MACROS = [
+    "CREATE MACRO iff(cond, a, b) AS CASE WHEN cond THEN a ELSE b END",
+    "CREATE MACRO try_to_double(x) AS TRY_CAST(x AS DOUBLE)",
+    "CREATE MACRO to_varchar(x) AS CAST(x AS VARCHAR)",
+    # -- The mirror only stores scalars, so nothing is ever an array or object
+    "CREATE MACRO is_array(x) AS false",
+    "CREATE MACRO is_object(x) AS false",
+]
+
+_TABLE_RE = re.compile(r"\baxelar\.axelscan\.(fact_transfers|fact_gmp)\b", re.IGNORECASE)
+# -- data:send:amount, data:call.chain, data:gas_price_rate:source_token.token_price.usd ...
+_PATH_RE = re.compile(r"\bdata:([A-Za-z_]\w*(?:[:.][A-Za-z_]\w*)*)")
+_STRING_CAST_RE = re.compile(r"::STRING\b", re.IGNORECASE)
+# -- Unquoted Snowflake identifiers come back upper-cased; DuckDB keeps them as written
+_UNQUOTED_NAME_RE = re.compile(r"^[a-z_][a-z0-9_]*$")
+
+
+def translate(query):
+    """Rewrite dashboard Snowflake SQL into DuckDB SQL over the mirror views."""
+    query = _TABLE_RE.sub(r"\1", query)
+    query = _PATH_RE.sub(
+        lambda match: "data." + ".".join(f'"{field}"' for field in re.split(r"[:.]", match.group(1))),
+        query,
+    )
+    return _STRING_CAST_RE.sub("::VARCHAR", query)
+
+
+def snapshot_through():
+    """Last day (both tables) no later sync will change, or None if there is no snapshot."""
+    days = []
+    for table, last in mirror.watermarks().items():
+        if last is None or not mirror.has_days(table):
+            return None
+        # -- The next sync re-pulls the REFRESH_DAYS before the watermark day, and that day itself may
+        # -- still receive rows, so only days before them are final and safe to index or cache for good
+        days.append(last.date() - pd.Timedelta(days=mirror.REFRESH_DAYS + 1))
+    return min(days)
+
+
+@st.cache_resource
+def _duckdb():
+    con = duckdb.connect(database=":memory:")
+    for macro in _MACROS:
+        con.execute(macro)
+    for table, view in _VIEWS.items():
+        path = (mirror.table_dir(table) / "*.parquet").as_posix()
+        con.execute(f"CREATE VIEW {table} AS {view.format(path=path)}")
+    return con, threading.Lock()
+
+
+def _duckdb_cursor():
+    con, lock = _duckdb()
+    with lock:
+        return con.cursor()
+
+
+def _snowflake_names(df):
+    df.columns = [column.upper() if _UNQUOTED_NAME_RE.match(column) else column for column in df.columns]
+    return df
+
+
+def read_duckdb(query, params=None):
+    sql, args = bind(translate(query), params or {}, "duckdb")
+    return _snowflake_names(_duckdb_cursor().execute(sql, args or None).df())
+
+
+def iter_duckdb(query, params=None, batch_rows=STREAM_BATCH_ROWS):
+    """Yield ``query``'s result as DataFrames of up to ``batch_rows`` rows."""
+    sql, args = bind(translate(query), params or {}, "duckdb")
+    cursor = _duckdb_cursor()
+    for batch in cursor.execute(sql, args or None).fetch_record_batch(batch_rows):
+        yield _snowflake_names(batch.to_pandas())
+
+
+def _use_duckdb(through):
+    if ENGINE != "auto":
+        return ENGINE == "duckdb"
+    last_day = snapshot_through()
+    return last_day is not None and through is not None and pd.Timestamp(through).date() <= last_day
+
+
+def run_query(query, params=None, through=None):
+    """Run the ``query`` template with ``params``; it only needs data up to the date ``through``.
+
+    ``through=None`` means the query needs data up to now, which the snapshot
+    never guarantees, so it runs on Snowflake unless the engine is offline.
+    """
+    if not _use_duckdb(through):
+        return read_sql(query, params)
+    if ENGINE == "duckdb":
+        return read_duckdb(query, params)
+    try:
+        return read_duckdb(query, params)
+    except duckdb.Error:
+        return read_sql(query, params)
+
+
+def iter_query(query, params=None, through=None):
+    """Like ``run_query``, but yield the result in batches as the backend produces them."""
+    if not _use_duckdb(through):
+        yield from iter_sql(query, params)
+        return
+    batches = iter_duckdb(query, params)
+    try:
+        # -- Binding errors surface on the first batch, before anything has been yielded
+        first = next(batches, None)
+    except duckdb.Error:
+        if ENGINE == "duckdb":
+            raise
+        yield from iter_sql(query, params)
+        return
+    if first is not None:
+        yield first
+        yield from batches
@@ -0,0 +1,47 @@
+"""Cross-session cache of built Plotly figures.
+
+``cached_figure`` keys a chart on a fingerprint of its input frame plus the
+keyword parameters of its build function, and keeps the figure as a plain
+dict in ``st.cache_data``. Reruns and other sessions that chart the same data
+(typically the default date range) get the dict back and hand it straight to
+``st.plotly_chart``, with no ``go.Figure`` rebuilt or re-validated in between.
+
+Charts are keyed on the frame they are drawn from (the grouped or pivoted
+series, not the raw rows), so the fingerprint stays cheap. Figures whose frame
+has only a handful of rows, such as two-slice donuts, build faster than they
+hash and are not worth routing through here.
+"""
+
+import hashlib
+
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+FIGURE_TTL = 3600
+MAX_FIGURES = 256
+
+
+def fingerprint(df):
+    """Digest of a frame's columns, dtypes, index and values."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr([(str(column), str(dtype)) for column, dtype in df.dtypes.items()]).encode())
+    digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+@st.cache_data(ttl=FIGURE_TTL, max_entries=MAX_FIGURES, show_spinner=False)
+def _figure_dict(builder, data_key, params, _build, _df):
+    return _build(_df, **dict(params)).to_dict()
+
+
+def cached_figure(build, df, **params):
+    """``build(df, **params).to_dict()``, served from the figure cache when the same chart was already built.
+
+    ``build`` must depend only on its arguments; ``params`` must be hashable.
+    """
+    # -- Pages all run as __main__, so the defining file tells same-named builders apart
+    builder = f"{build.__code__.co_filename}:{build.__qualname__}"
+    figure = _figure_dict(builder, fingerprint(df), tuple(sorted(params.items())), build, df)
+    # -- st.plotly_chart rejects a dict without traces, so an empty chart goes back as a Figure
+    return figure if figure.get("data") else go.Figure(figure)
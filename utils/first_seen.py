@@ -0,0 +1,110 @@
+"""Persisted user -> first-seen-date index built incrementally from the mirror.
+
+The index holds one row per user with the first day they appeared, where a
+user is a token-transfer recipient or a GMP transaction sender (the Users
+Activity page's definition). ``update`` only reads the mirror day files after
+the index watermark, and appends the users among them that are not indexed
+yet, so New, Cumulative and Recurring users become a range lookup on
+``first_date`` instead of a ``MIN(created_at)`` over the full history.
+
+Rows are appended in ``first_date`` order, which keeps range reads pruned to
+the row groups they need.
+"""
+
+import json
+import os
+
+import duckdb
+import pandas as pd
+import streamlit as st
+
+from utils import mirror, resample, rollup
+from utils.engine import snapshot_through
+
+INDEX_FILE = "first_seen.parquet"
+STATE_FILE = "first_seen.json"
+
+_USERS = {
+    "fact_transfers": "SELECT recipient_address AS user, created_at::DATE AS day FROM read_parquet({paths})",
+    "fact_gmp": "SELECT sender_address AS user, created_at::DATE AS day FROM read_parquet({paths})",
+}
+
+
+def index_through():
+    """Last day the index is complete for, or None if it has not been built."""
+    path = rollup.ROLLUP_DIR / STATE_FILE
+    if not path.exists():
+        return None
+    return pd.Timestamp(json.loads(path.read_text())["through"]).date()
+
+
+def covers(end_date):
+    through = index_through()
+    return through is not None and pd.Timestamp(end_date).date() <= through
+
+
+def _day_files(table, after, through):
+    """Mirror day files of ``table`` for ``after < day <= through``."""
+    paths = []
+    for path in sorted(mirror.table_dir(table).glob("*.parquet")):
+        day = pd.Timestamp(path.stem).date()
+        if (after is None or day > after) and day <= through:
+            paths.append(path.as_posix())
+    return paths
+
+
+def update():
+    """Index the users first seen since the last update and return how many were added."""
+    through = snapshot_through()
+    if through is None:
+        raise RuntimeError("The mirror is empty; run sync_mirror.py first")
+    after = index_through()
+    if after is not None and after >= through:
+        return 0
+
+    branches = []
+    for table, select in _USERS.items():
+        paths = _day_files(table, after, through)
+        if paths:
+            branches.append(select.format(paths=paths))
+
+    index_path = rollup.ROLLUP_DIR / INDEX_FILE
+    added = 0
+    if branches:
+        con = duckdb.connect(database=":memory:")
+        con.execute(f"""
+            CREATE TABLE new_users AS
+            SELECT user, MIN(day) AS first_date
+            FROM ({" UNION ALL ".join(branches)})
+            WHERE user IS NOT NULL
+            GROUP BY user
+        """)
+        if index_path.exists():
+            con.execute(f"DELETE FROM new_users WHERE user IN (SELECT user FROM read_parquet('{index_path.as_posix()}'))")
+            existing = f"SELECT user, first_date FROM read_parquet('{index_path.as_posix()}') UNION ALL "
+        else:
+            existing = ""
+        added = con.execute("SELECT COUNT(*) FROM new_users").fetchone()[0]
+        rollup.ROLLUP_DIR.mkdir(parents=True, exist_ok=True)
+        # -- Write next to the index and swap it in, so readers never see a partial file
+        tmp_path = index_path.with_suffix(".tmp")
+        con.execute(f"""
+            COPY ({existing}SELECT user, first_date FROM (SELECT * FROM new_users ORDER BY first_date))
+            TO '{tmp_path.as_posix()}' (FORMAT PARQUET, COMPRESSION ZSTD)
+        """)
+        os.replace(tmp_path, index_path)
+    (rollup.ROLLUP_DIR / STATE_FILE).write_text(json.dumps({"through": through.isoformat()}))
+    return added
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def load_new_users(start_date, end_date, timeframe):
+    """Users first seen in each ``timeframe`` bucket with ``start_date <= first_date <= end_date``."""
+    filters = [
+        ("first_date", ">=", pd.Timestamp(start_date).date()),
+        ("first_date", "<=", pd.Timestamp(end_date).date()),
+    ]
+    index = pd.read_parquet(rollup.ROLLUP_DIR / INDEX_FILE, columns=["first_date"], filters=filters)
+    first_date = pd.to_datetime(index["first_date"])
+    counts = resample.period_start(first_date, timeframe).value_counts().sort_index()
+    return counts.rename_axis("Date").reset_index(name="New Users")
@@ -0,0 +1,123 @@
+"""Pooled, bounded HTTP access to the axelarscan API.
+
+All pages share one keep-alive session with retry/backoff, and ``fetch_many``
+fans a list of URLs out over a small thread pool with an overall deadline, so
+a cold load costs about as much as the slowest endpoint and a hung endpoint
+only drops its own series. ``prefetch`` warms a cached fetcher in the
+background without blocking the rerun. Both share one table of in-flight
+fetches, so a URL that is still running (or hung) from an earlier rerun is
+waited on rather than submitted again.
+"""
+
+import inspect
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+
+import requests
+import streamlit as st
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from utils.scheduler import submit
+
+MAX_WORKERS = 8
+# -- (connect, read) timeout per attempt, in seconds
+TIMEOUT = (3.05, 10)
+RETRIES = 2
+BACKOFF = 0.5
+# -- Upper bound for a whole fetch_many call. One URL whose every attempt times out takes
+# -- 3 x 13.05s plus 1s of backoff (none before the first retry), about 40s, so it fits
+DEADLINE = 45
+
+
+@st.cache_resource
+def get_session():
+    retry = Retry(
+        total=RETRIES,
+        backoff_factor=BACKOFF,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"GET"}),
+        # -- A long Retry-After would blow the deadline; the backoff above is the only wait
+        respect_retry_after_header=False,
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=MAX_WORKERS, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+@st.cache_resource
+def _executor():
+    return ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="http")
+
+
+@st.cache_resource
+def _in_flight():
+    return {}, threading.Lock()
+
+
+def _fetch_key(fetch):
+    # -- Pages all run as __main__ and redefine their fetchers on every rerun, so the defining file and
+    # -- name identify a fetcher across reruns; unwrap st.cache_data functions to reach their code
+    return f"{inspect.unwrap(fetch).__code__.co_filename}:{fetch.__qualname__}"
+
+
+def _submit_once(fetch, urls):
+    """``{url: Future}`` of ``fetch(url)``, reusing the fetches still in flight for the same fetcher."""
+    in_flight, lock = _in_flight()
+    key = _fetch_key(fetch)
+    futures, submitted = {}, []
+    with lock:
+        for url in dict.fromkeys(urls):
+            future = in_flight.get((key, url))
+            if future is None:
+                future = in_flight[(key, url)] = submit(_executor(), fetch, url)
+                submitted.append(url)
+            futures[url] = future
+    # -- Outside the lock: a fetch that already finished runs its callback right here
+    for url in submitted:
+        futures[url].add_done_callback(lambda _, url=url: _done(key, url))
+    return futures
+
+
+def _done(key, url):
+    in_flight, lock = _in_flight()
+    with lock:
+        in_flight.pop((key, url), None)
+
+
+def fetch_json(url):
+    response = get_session().get(url, timeout=TIMEOUT)
+    response.raise_for_status()
+    return response.json()
+
+
+def fetch_many(fetch, urls, deadline=DEADLINE):
+    """Run ``fetch(url)`` for every distinct URL concurrently.
+
+    Returns ``(results, errors)`` keyed by URL. URLs that fail or are still
+    running when the deadline passes land in ``errors`` instead of raising;
+    a running fetch keeps going and is picked up by the next call.
+    """
+    futures = _submit_once(fetch, urls)
+    done, _ = wait(futures.values(), timeout=deadline)
+
+    results, errors = {}, {}
+    for url, future in futures.items():
+        if future not in done:
+            errors[url] = TimeoutError(f"no response within {deadline}s")
+        elif future.exception() is not None:
+            errors[url] = future.exception()
+        else:
+            results[url] = future.result()
+    return results, errors
+
+
+def prefetch(fetch, urls):
+    """Call ``fetch(url)`` for every URL in the background, without waiting.
+
+    ``fetch`` is expected to be a ``st.cache_data`` function, so this only
+    warms its cache; URLs already in flight are not submitted twice.
+    """
+    _submit_once(fetch, urls)
@@ -0,0 +1,166 @@
+"""Local Parquet mirror of the fact_transfers / fact_gmp columns the dashboard uses.
+
+The mirror keeps one zstd-compressed Parquet file per table and calendar day
+under ``MIRROR_DIR``. Each sync only re-pulls the days from the current
+``created_at`` watermark onwards (plus ``REFRESH_DAYS`` of overlap, which
+catches rows whose status flipped to executed after they were mirrored) and
+rewrites those day files whole, so a sync is idempotent and moves roughly one
+day of data instead of the full history.
+
+VARIANT paths are flattened once here, so readers never re-parse ``data:``.
+"""
+
+import json
+import os
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pandas as pd
+
+from utils.db import read_sql
+
+MIRROR_DIR = Path(os.environ.get("AXELAR_MIRROR_DIR", Path(__file__).resolve().parent.parent / "data" / "mirror"))
+STATE_FILE = "state.json"
+# -- Days before the watermark day that are re-pulled on every sync
+REFRESH_DAYS = 1
+# -- Size of the windows used for the initial backfill
+BACKFILL_WINDOW = timedelta(days=31)
+
+TABLES = {
+    "fact_transfers": """
+        SELECT created_at,
+               TO_VARCHAR(id) AS id,
+               status,
+               simplified_status,
+               sender_address,
+               recipient_address,
+               data:send:original_source_chain::STRING AS source_chain,
+               data:send:original_destination_chain::STRING AS destination_chain,
+               TRY_TO_DOUBLE(data:send:amount::STRING) AS amount,
+               TRY_TO_DOUBLE(data:link:price::STRING) AS price,
+               TRY_TO_DOUBLE(data:send:amount::STRING) * TRY_TO_DOUBLE(data:link:price::STRING) AS amount_usd,
+               TRY_TO_DOUBLE(data:send:fee_value::STRING) AS fee,
+               data:link:asset::STRING AS asset
+        FROM axelar.axelscan.fact_transfers
+    """,
+    "fact_gmp": """
+        SELECT created_at,
+               TO_VARCHAR(id) AS id,
+               status,
+               simplified_status,
+               data:call:transaction:from::STRING AS sender_address,
+               data:approved:returnValues:contractAddress::STRING AS contract_address,
+               data:call:chain::STRING AS source_chain,
+               data:call:returnValues:destinationChain::STRING AS destination_chain,
+               TRY_TO_DOUBLE(data:amount::STRING) AS amount,
+               TRY_TO_DOUBLE(data:value::STRING) AS amount_usd,
+               TRY_TO_DOUBLE(data:gas:gas_used_amount::STRING) AS gas_used_amount,
+               TRY_TO_DOUBLE(data:gas_price_rate:source_token.token_price.usd::STRING) AS gas_token_price_usd,
+               TRY_TO_DOUBLE(data:fees:express_fee_usd::STRING) AS express_fee_usd,
+               COALESCE(
+                   TRY_TO_DOUBLE(data:gas:gas_used_amount::STRING)
+                       * TRY_TO_DOUBLE(data:gas_price_rate:source_token.token_price.usd::STRING),
+                   TRY_TO_DOUBLE(data:fees:express_fee_usd::STRING)
+               ) AS fee,
+               data:symbol::STRING AS asset
+        FROM axelar.axelscan.fact_gmp
+    """,
+}
+
+
+def table_dir(table):
+    return MIRROR_DIR / table
+
+
+def _load_state():
+    path = MIRROR_DIR / STATE_FILE
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())
+
+
+def _save_state(state):
+    MIRROR_DIR.mkdir(parents=True, exist_ok=True)
+    (MIRROR_DIR / STATE_FILE).write_text(json.dumps(state, indent=2, sort_keys=True))
+
+
+def watermarks():
+    """``{table: latest mirrored created_at}``, None for tables not synced yet, from one state read."""
+    state = _load_state()
+    return {table: datetime.fromisoformat(state[table]) if state.get(table) else None for table in TABLES}
+
+
+def watermark(table):
+    """Latest mirrored ``created_at`` for ``table``, or None before the first sync."""
+    return watermarks()[table]
+
+
+def has_days(table):
+    """Whether any day of ``table`` is held locally; stops at the first day file instead of listing them all."""
+    return next(table_dir(table).glob("*.parquet"), None) is not None
+
+
+def _fetch_window(table, start, end):
+    query = f"""
+    {TABLES[table]}
+    WHERE status = 'executed'
+      AND simplified_status = 'received'
+      AND created_at >= %(start)s
+      AND created_at < %(end)s
+    """
+    df = read_sql(query, {"start": start, "end": end})
+    df.columns = [column.lower() for column in df.columns]
+    df["created_at"] = pd.to_datetime(df["created_at"])
+    return df
+
+
+def _write_days(table, df, start, end):
+    """Rewrite every day file in ``[start, end)``; days without rows are removed."""
+    out = table_dir(table)
+    out.mkdir(parents=True, exist_ok=True)
+    by_day = dict(tuple(df.groupby(df["created_at"].dt.date))) if not df.empty else {}
+    day = start
+    while day < end:
+        path = out / f"{day.isoformat()}.parquet"
+        if day in by_day:
+            # -- Write next to the day file and swap it in, so DuckDB views and the rollup never glob a partial file
+            tmp_path = path.with_suffix(".tmp")
+            by_day[day].sort_values("created_at").to_parquet(tmp_path, compression="zstd", index=False)
+            os.replace(tmp_path, path)
+        elif path.exists():
+            path.unlink()
+        day += timedelta(days=1)
+
+
+def sync_table(table, now=None):
+    """Bring ``table``'s mirror up to ``now`` and return the number of rows pulled."""
+    now = now or datetime.utcnow()
+    end = now.date() + timedelta(days=1)
+    last = watermark(table)
+    if last is None:
+        first = read_sql(f"SELECT MIN(created_at) AS first_created_at FROM axelar.axelscan.{table}").iloc[0, 0]
+        start = pd.Timestamp(first).date()
+    else:
+        start = last.date() - timedelta(days=REFRESH_DAYS)
+
+    pulled = 0
+    newest = last
+    window_start = start
+    while window_start < end:
+        window_end = min(window_start + BACKFILL_WINDOW, end)
+        df = _fetch_window(table, window_start, window_end)
+        _write_days(table, df, window_start, window_end)
+        pulled += len(df)
+        if not df.empty:
+            newest = max(newest or datetime.min, df["created_at"].max().to_pydatetime())
+            # -- Persist after every window so an interrupted backfill resumes where it stopped
+            state = _load_state()
+            state[table] = newest.isoformat()
+            _save_state(state)
+        window_start = window_end
+    return pulled
+
+
+def sync(now=None):
+    return {table: sync_table(table, now) for table in TABLES}
+
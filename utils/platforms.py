@@ -0,0 +1,89 @@
+"""Registry of the platforms built on Axelar and their contract addresses.
+
+This is the single source for everything keyed on platform contracts: the
+axelarscan chart / route-stats URLs the pages fetch, the SQL relation the
+Platforms query joins on and the mirror rollup's platform column. Adding a
+platform or a contract is one entry in ``PLATFORM_CONTRACTS``.
+"""
+
+import streamlit as st
+
+from utils.http import fetch_json
+
+API_URL = "https://api.axelarscan.io"
+ENDPOINTS = {
+    "GMPChart": "gmp/GMPChart",
+    "GMPStatsByChains": "gmp/GMPStatsByChains",
+    "transfersChart": "token/transfersChart",
+}
+
+PLATFORM_CONTRACTS = {
+    "Interchain Token Service": [
+        "0xB5FB4BE02232B1bBA4dC8f81dc24C26980dE9e3C",
+        "axelar1aqcj54lzz0rk22gvqgcn8fr5tx4rzwdv5wv5j9dmnacgefvd7wzsy2j2mr",
+    ],
+    "Squid": [
+        "0xce16F69375520ab01377ce7B88f5BA8C48F8D666",
+        "0xdf4fFDa22270c12d0b5b3788F1669D709476111E",
+        "0xe6B3949F9bBF168f4E3EFc82bc8FD849868CC6d8",
+        "0x492751eC3c57141deb205eC2da8bFcb410738630",
+        "0xDC3D8e1Abe590BCa428a8a2FC4CfDbD1AcF57Bd9",
+    ],
+    "MintDAO Bridge": ["0xD0FFD6fE14b2037897Ad8cD072F6d6DE30CF8e56"],
+    "Prime Protocol": ["0xbe54BaFC56B468d4D20D609F0Cf17fFc56b99913"],
+    "Rango Exchange": ["0x0ADFb7975aa7c3aD90c57AEa8FDe5E31a721E9bb"],
+    "The Junkyard": ["0x66423a1b45e14EaB8B132665FebC7Ec86BfcBF44"],
+    "Nya Bridge": ["0xcbBA104B6CB4960a70E5dfc48E76C536A1f19609"],
+    "eesee.io": ["0xEac19c899098951fc6d0e6a7832b090474E2C292"],
+}
+# -- Contracts that also route token transfers, charted through transfersChart as well as GMPChart
+TRANSFER_CONTRACTS = ["0xce16F69375520ab01377ce7B88f5BA8C48F8D666"]
+
+
+def platform_by_address():
+    """``{lowercase address: platform}`` for every registered contract."""
+    return {
+        address.lower(): platform
+        for platform, addresses in PLATFORM_CONTRACTS.items()
+        for address in addresses
+    }
+
+
+def registry_sql():
+    """The registry as a SQL ``(address, platform)`` relation with lowercase addresses.
+
+    Join it on ``LOWER(<address column>)`` to classify rows with one hash probe
+    each, in Snowflake or DuckDB alike.
+    """
+    rows = ",\n".join(f"('{address}', '{platform}')" for address, platform in platform_by_address().items())
+    return f"select address, platform from (values\n{rows}\n) as registry(address, platform)"
+
+
+def api_url(endpoint, address):
+    return f"{API_URL}/{ENDPOINTS[endpoint]}?contractAddress={address}"
+
+
+def platform_urls(*endpoints):
+    """``{platform: [url, ...]}`` for every registered contract on each of ``endpoints``.
+
+    Each (endpoint, contract) pair yields exactly one URL, so every page that
+    asks for it shares the same ``fetch_contract_json`` cache entry.
+    """
+    transfer_contracts = {address.lower() for address in TRANSFER_CONTRACTS}
+    seen = set()
+    urls = {}
+    for platform, addresses in PLATFORM_CONTRACTS.items():
+        for endpoint in endpoints:
+            for address in addresses:
+                key = (endpoint, address.lower())
+                if key in seen or (endpoint == "transfersChart" and key[1] not in transfer_contracts):
+                    continue
+                seen.add(key)
+                urls.setdefault(platform, []).append(api_url(endpoint, address))
+    return urls
+
+
+@st.cache_data(ttl=3600, max_entries=128, show_spinner=False)
+def fetch_contract_json(url):
+    """Cached axelarscan response for one registry URL, shared by every page."""
+    return fetch_json(url)
@@ -0,0 +1,49 @@
+"""Vectorized day / week / month bucketing shared by the pages.
+
+``period_start`` maps timestamps to the start of their bucket with plain
+datetime64 arithmetic (weeks start on Monday, like ``to_period('W')`` and
+Snowflake's ``DATE_TRUNC('week', ...)``), instead of building a ``Period``
+object and calling a lambda per row. ``aggregate`` sums columns per bucket and
+optional keys such as the platform, and ``round_half_up`` rounds per-period
+averages the way the SQL they replace did.
+"""
+
+import numpy as np
+import pandas as pd
+
+# -- 1970-01-01 was a Thursday, i.e. day 3 of a Monday-based week
+_EPOCH_WEEKDAY = 3
+
+
+def period_start(timestamps, timeframe):
+    """Start of the ``timeframe`` ("day", "week" or "month") bucket for each timestamp."""
+    timestamps = pd.Series(timestamps)
+    days = timestamps.to_numpy(dtype="datetime64[ns]").astype("datetime64[D]")
+    if timeframe == "week":
+        offsets = (days.view("int64") + _EPOCH_WEEKDAY) % 7
+        starts = days - offsets.astype("timedelta64[D]")
+    elif timeframe == "month":
+        starts = days.astype("datetime64[M]").astype("datetime64[D]")
+    else:
+        starts = days
+    # -- NaT survives the casts but not the weekday arithmetic
+    starts = np.where(np.isnat(days), np.datetime64("NaT"), starts)
+    return pd.Series(starts.astype("datetime64[ns]"), index=timestamps.index, name=timestamps.name)
+
+
+def aggregate(df, timeframe, by=(), columns=None, time_column="timestamp"):
+    """Sum ``columns`` (default: all numeric ones) per ``timeframe`` bucket and ``by`` keys.
+
+    The bucket start comes back as a ``period`` column, followed by the keys.
+    """
+    by = list(by)
+    if columns is None:
+        columns = [column for column in df.select_dtypes("number").columns if column not in by]
+    period = period_start(df[time_column], timeframe).rename("period")
+    grouped = df.groupby([period] + [df[key] for key in by], sort=True)[list(columns)].sum()
+    return grouped.reset_index()
+
+
+def round_half_up(values):
+    """Match Snowflake's ROUND, which goes half away from zero (pandas rounds half to even); counts are never negative."""
+    return np.floor(values + 0.5)
@@ -0,0 +1,149 @@
+"""Daily multi-dimensional rollup built from the local mirror.
+
+``build`` aggregates the mirrored fact tables into one row per day, service,
+source chain, destination chain, asset and platform, carrying transfer
+counts and amount/volume/fee sums, plus HyperLogLog sketches of the users
+active per day, service and role, keyed by source chain, by platform and by
+asset (see ``utils.hll``). Page loaders read these instead of the fact
+tables, so each chart is a cheap group-by and distinct-user metrics for any
+window are a sketch merge.
+
+Chains are lower-cased. Assets stay raw, so symbol mapping happens after
+aggregation. Token transfers are sketched for both their sender and their
+recipient role, since pages count either as the user; GMP users are always
+the transaction sender.
+
+Files are written next to their target and swapped in with ``os.replace``,
+so a page load during a rebuild reads either the old or the new rollup.
+"""
+
+import json
+import os
+
+import duckdb
+import pandas as pd
+import streamlit as st
+
+from utils import hll, mirror
+from utils.engine import snapshot_through
+from utils.platforms import platform_by_address
+
+ROLLUP_DIR = mirror.MIRROR_DIR.parent / "rollup"
+DAILY_FILE = "daily.parquet"
+USER_SKETCHES_FILE = "daily_user_sketches.parquet"
+PLATFORM_USER_SKETCHES_FILE = "daily_platform_user_sketches.parquet"
+ASSET_USER_SKETCHES_FILE = "daily_asset_user_sketches.parquet"
+STATE_FILE = "state.json"
+
+DIMENSIONS = ["day", "service", "source_chain", "destination_chain", "asset", "platform"]
+# -- Sketch file per dimension users are counted by; each is also keyed on day, service and role
+USER_SKETCHES = {
+    "source_chain": USER_SKETCHES_FILE,
+    "platform": PLATFORM_USER_SKETCHES_FILE,
+    "asset": ASSET_USER_SKETCHES_FILE,
+}
+
+_EVENTS = """
+    SELECT created_at::DATE AS day, 'Token Transfers' AS service,
+           LOWER(source_chain) AS source_chain, LOWER(destination_chain) AS destination_chain,
+           asset, LOWER(sender_address) AS address, id, sender_address AS user,
+           recipient_address AS recipient, amount, amount_usd, fee
+    FROM read_parquet('{transfers}')
+    UNION ALL
+    SELECT created_at::DATE AS day, 'GMP' AS service,
+           LOWER(source_chain) AS source_chain, LOWER(destination_chain) AS destination_chain,
+           asset, LOWER(contract_address) AS address, id, sender_address AS user,
+           NULL AS recipient, amount, amount_usd, fee
+    FROM read_parquet('{gmp}')
+"""
+
+_DAILY = """
+    WITH events AS ({events})
+    SELECT day, service, source_chain, destination_chain, asset, registry.platform,
+           COUNT(DISTINCT id) AS tx_count,
+           SUM(amount_usd) AS volume,
+           COUNT(amount_usd) AS volume_count,
+           SUM(amount) AS amount,
+           SUM(fee) AS fee,
+           COUNT(fee) AS fee_count
+    FROM events
+    LEFT JOIN registry USING (address)
+    GROUP BY ALL
+"""
+
+_DAILY_USERS = """
+    WITH events AS ({events})
+    SELECT DISTINCT day, service, source_chain, asset, registry.platform, 'sender' AS role, user
+    FROM events
+    LEFT JOIN registry USING (address)
+    WHERE user IS NOT NULL
+    UNION
+    SELECT DISTINCT day, service, source_chain, asset, registry.platform, 'recipient' AS role, recipient AS user
+    FROM events
+    LEFT JOIN registry USING (address)
+    WHERE recipient IS NOT NULL
+"""
+
+
+def build():
+    """Rebuild the rollup from the mirror and return its row counts."""
+    through = snapshot_through()
+    if through is None:
+        raise RuntimeError("The mirror is empty; run sync_mirror.py first")
+
+    events = _EVENTS.format(
+        transfers=(mirror.table_dir("fact_transfers") / "*.parquet").as_posix(),
+        gmp=(mirror.table_dir("fact_gmp") / "*.parquet").as_posix(),
+    )
+    registry = pd.DataFrame(list(platform_by_address().items()), columns=["address", "platform"])
+
+    con = duckdb.connect(database=":memory:")
+    con.register("registry", registry)
+    ROLLUP_DIR.mkdir(parents=True, exist_ok=True)
+    # -- Write next to each file and swap it in, so readers never see a partial file
+    daily_path = ROLLUP_DIR / DAILY_FILE
+    tmp_path = daily_path.with_suffix(".tmp")
+    con.execute(f"COPY ({_DAILY.format(events=events)}) TO '{tmp_path.as_posix()}' (FORMAT PARQUET, COMPRESSION ZSTD)")
+    counts = {DAILY_FILE: con.execute(f"SELECT COUNT(*) FROM read_parquet('{tmp_path.as_posix()}')").fetchone()[0]}
+    os.replace(tmp_path, daily_path)
+
+    users = con.execute(_DAILY_USERS.format(events=events)).df()
+    for dimension, file in USER_SKETCHES.items():
+        # -- Source-chain sketches count every user; the others only users with a platform / asset
+        keyed = users if dimension == "source_chain" else users[users[dimension].notna()]
+        sketches = hll.sketch(keyed, ["day", "service", dimension, "role"], "user")
+        tmp_path = (ROLLUP_DIR / file).with_suffix(".tmp")
+        sketches.to_parquet(tmp_path, compression="zstd", index=False)
+        os.replace(tmp_path, ROLLUP_DIR / file)
+        counts[file] = len(sketches)
+    (ROLLUP_DIR / STATE_FILE).write_text(json.dumps({"through": through.isoformat()}))
+    return counts
+
+
+def rollup_through():
+    """Last day the rollup is complete for, or None if it has not been built."""
+    path = ROLLUP_DIR / STATE_FILE
+    if not path.exists():
+        return None
+    return pd.Timestamp(json.loads(path.read_text())["through"]).date()
+
+
+def covers(end_date):
+    through = rollup_through()
+    return through is not None and pd.Timestamp(end_date).date() <= through
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def load_daily(start_date, end_date, file=DAILY_FILE):
+    """Rollup rows with ``start_date <= day <= end_date``."""
+    filters = [("day", ">=", pd.Timestamp(start_date).date()), ("day", "<=", pd.Timestamp(end_date).date())]
+    df = pd.read_parquet(ROLLUP_DIR / file, filters=filters)
+    df["day"] = pd.to_datetime(df["day"])
+    return df
+
+
+def load_user_sketches(start_date, end_date, transfer_role="sender", by="source_chain"):
+    """Daily user sketches keyed on ``by``, counting token-transfer users by ``transfer_role``."""
+    sketches = load_daily(start_date, end_date, file=USER_SKETCHES[by])
+    return sketches[(sketches["service"] == "GMP") | (sketches["role"] == transfer_role)]
+
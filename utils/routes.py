@@ -0,0 +1,53 @@
+"""Sparse source x destination route totals for the Routes heatmaps.
+
+A platform only uses a small share of the (source, destination) pairs, so a
+dense pivot of every source against every destination is mostly zeros.
+``route_totals`` keeps the pairs that exist, once per platform, and
+``top_k_matrix`` slices them by the selected chains and folds everything
+outside the ``k`` busiest sources and destinations into an "Other" row and
+column, so a heatmap never has more than ``(k + 1) ** 2`` cells.
+"""
+
+import pandas as pd
+import streamlit as st
+
+OTHER = "Other"
+VALUES = ["Volume of Transfers (USD)", "Number of Transfers"]
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def route_totals(df_transfers):
+    """``VALUES`` summed per (Destination Chain, Source Chain) pair present in ``df_transfers``."""
+    return df_transfers.groupby(["Destination Chain", "Source Chain"])[VALUES].sum()
+
+
+def _busiest(routes, level, k):
+    totals = routes.groupby(level=level).sum()
+    return totals.sort_values(ascending=False, kind="stable").index[:k]
+
+
+def top_k_matrix(totals, values, sources, destinations, k):
+    """Destination x source matrix of ``values`` over the selected chains, pruned to the top ``k`` per axis.
+
+    Rows and columns are ordered busiest first, with the rest of the selected
+    chains summed into a trailing "Other" row or column.
+    """
+    dest = totals.index.get_level_values("Destination Chain")
+    src = totals.index.get_level_values("Source Chain")
+    routes = totals.loc[dest.isin(destinations) & src.isin(sources), values]
+    if routes.empty:
+        return pd.DataFrame()
+
+    top_dest = _busiest(routes, "Destination Chain", k)
+    top_src = _busiest(routes, "Source Chain", k)
+    dest = routes.index.get_level_values("Destination Chain")
+    src = routes.index.get_level_values("Source Chain")
+    rows = dest.where(dest.isin(top_dest), OTHER)
+    cols = src.where(src.isin(top_src), OTHER)
+    matrix = routes.groupby([rows, cols]).sum().unstack(fill_value=0)
+
+    row_order = list(top_dest) + ([OTHER] if OTHER in matrix.index else [])
+    col_order = list(top_src) + ([OTHER] if OTHER in matrix.columns else [])
+    matrix = matrix.reindex(index=row_order, columns=col_order, fill_value=0)
+    matrix.index.name, matrix.columns.name = "Destination Chain", "Source Chain"
+    return matrix
@@ -0,0 +1,47 @@
+"""Run a page's independent loaders concurrently.
+
+Pages submit every loader up front and only block on a loader's future where
+its section is rendered, so page latency tracks the slowest query rather than
+the sum of all of them.
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+# -- Most jobs a page submits at once (the Interchain page has 5)
+JOBS_PER_PAGE = 5
+# -- Page loads expected to run at the same time
+EXPECTED_SESSIONS = int(os.environ.get("AXELAR_EXPECTED_SESSIONS", 4))
+# -- Sized for every page load's jobs to start at once, so cache hits and HTTP jobs never queue behind
+# -- another viewer's warehouse query; the connection pool already bounds warehouse concurrency
+MAX_WORKERS = JOBS_PER_PAGE * EXPECTED_SESSIONS
+
+
+@st.cache_resource
+def _executor():
+    return ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="loader")
+
+
+def submit(executor, loader, *args):
+    """Submit ``loader(*args)`` with the caller's script context attached.
+
+    This keeps ``st.cache_data`` lookups inside the loader behaving exactly as
+    they do on the script thread.
+    """
+    ctx = get_script_run_ctx()
+
+    def run():
+        add_script_run_ctx(threading.current_thread(), ctx)
+        return loader(*args)
+
+    return executor.submit(run)
+
+
+def submit_all(jobs, executor=None):
+    """Submit ``{name: (loader, *args)}`` and return ``{name: Future}``."""
+    executor = executor or _executor()
+    return {name: submit(executor, job[0], *job[1:]) for name, job in jobs.items()}
@@ -0,0 +1,80 @@
+"""Calendar-month result shards for date-range loaders.
+
+A sharded loader is a plain function ``loader(shard_start, shard_end, *args)``
+whose result for disjoint date ranges can be concatenated. ``load_sharded``
+splits the requested range into calendar months, keeps closed months cached
+for good, re-queries only the current (open) month when its TTL expires and
+runs all missing shards in parallel, so moving the end date by a day costs at
+most one month of warehouse work.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+import pandas as pd
+import streamlit as st
+
+from utils.db import POOL_SIZE
+from utils.scheduler import submit_all
+
+OPEN_SHARD_TTL = 3600
+CLOSED_SHARD_MAX_ENTRIES = 1024
+
+
+def month_shards(start_date, end_date, today=None):
+    """Split ``[start_date, end_date]`` into ``(shard_start, shard_end, closed)`` per month.
+
+    A shard is closed once its month lies entirely before the current month.
+    """
+    today = today or datetime.utcnow().date()
+    current_month = today.replace(day=1)
+    shards = []
+    shard_start = start_date
+    while shard_start <= end_date:
+        next_month = (shard_start.replace(day=1) + timedelta(days=32)).replace(day=1)
+        shard_end = min(end_date, next_month - timedelta(days=1))
+        shards.append((shard_start, shard_end, next_month <= current_month))
+        shard_start = next_month
+    return shards
+
+
+# -- Separate from the page scheduler: pages run sharded loaders on that pool and
+# -- wait on their shards here, so sharing one pool could deadlock it
+@st.cache_resource
+def _executor():
+    return ThreadPoolExecutor(max_workers=POOL_SIZE, thread_name_prefix="shard")
+
+
+@st.cache_data(ttl=None, max_entries=CLOSED_SHARD_MAX_ENTRIES, show_spinner=False)
+def _closed_shard(_loader, loader_key, shard_start, shard_end, args):
+    return _loader(shard_start, shard_end, *args)
+
+
+@st.cache_data(ttl=OPEN_SHARD_TTL, show_spinner=False)
+def _open_shard(_loader, loader_key, shard_start, shard_end, args):
+    return _loader(shard_start, shard_end, *args)
+
+
+def load_sharded(loader, start_date, end_date, *args, aligned=True):
+    """Concatenate ``loader``'s results over monthly shards of the date range.
+
+    Pass ``aligned=False`` when the loader's buckets can straddle month
+    boundaries in a non-additive way (e.g. distinct users per week); the range
+    is then loaded as a single shard with the open-shard TTL.
+    """
+    start_date, end_date = pd.Timestamp(start_date).date(), pd.Timestamp(end_date).date()
+    # -- Pages all run as __main__, so the defining file tells same-named loaders apart
+    loader_key = f"{loader.__code__.co_filename}:{loader.__qualname__}"
+    if aligned:
+        shards = month_shards(start_date, end_date)
+    else:
+        shards = [(start_date, end_date, False)]
+
+    futures = submit_all({
+        (shard_start, shard_end): (_closed_shard if closed else _open_shard, loader, loader_key, shard_start, shard_end, args)
+        for shard_start, shard_end, closed in shards
+    }, executor=_executor())
+    frames = [future.result() for future in futures.values()]
+    if not frames:
+        return pd.DataFrame()
+    return pd.concat(frames, ignore_index=True)
@@ -0,0 +1,59 @@
+"""Query templates with bind parameters.
+
+Dashboard SQL names its inputs as ``%(name)s`` placeholders instead of
+formatting values into the text, so a template's statement text is the same
+for every date range. That lets Snowflake's result cache (and DuckDB's plan
+cache) serve equivalent requests from any session, and keeps user input out of
+the SQL. ``bind`` compiles a template to the positional placeholders each
+backend expects.
+
+Values that cannot be bound, such as the ``DATE_TRUNC`` date part, go through
+``date_part``, which only lets whitelisted keywords into the text.
+"""
+
+import re
+
+import pandas as pd
+
+TIMEFRAMES = ("day", "week", "month")
+# -- Positional placeholder syntax per backend; both accept the same number more than once
+PLACEHOLDERS = {
+    "snowflake": ":{}",
+    "duckdb": "${}",
+}
+
+_PARAM_RE = re.compile(r"%\((\w+)\)s")
+
+
+def bind(template, params, style):
+    """Compile ``template`` for ``style`` and return ``(sql, args)`` for ``cursor.execute``."""
+    names = []
+
+    def placeholder(match):
+        name = match.group(1)
+        if name not in params:
+            raise KeyError(f"Missing bind parameter {name!r}")
+        if name not in names:
+            names.append(name)
+        return PLACEHOLDERS[style].format(names.index(name) + 1)
+
+    sql = _PARAM_RE.sub(placeholder, template)
+    return sql, [params[name] for name in names]
+
+
+def date_part(timeframe):
+    """``timeframe`` as a DATE_TRUNC date part, rejecting anything not in ``TIMEFRAMES``."""
+    if timeframe not in TIMEFRAMES:
+        raise ValueError(f"Unsupported timeframe {timeframe!r}; expected one of {TIMEFRAMES}")
+    return timeframe
+
+
+def time_range(start_date, end_date):
+    """Half-open ``[start_ts, end_ts)`` bind parameters covering the days ``start_date..end_date``.
+
+    Templates compare the raw ``created_at`` column against these instead of
+    ``created_at::date``, so Snowflake can prune micro-partitions on it.
+    """
+    start = pd.Timestamp(start_date).normalize()
+    end = pd.Timestamp(end_date).normalize() + pd.Timedelta(days=1)
+    return {"start_ts": start.to_pydatetime(), "end_ts": end.to_pydatetime()}
@@ -0,0 +1,55 @@
+"""Progressive loading of long result sets.
+
+``accumulate`` turns a stream of result batches (see ``utils.engine.iter_query``)
+into a stream of ever-larger frames, so a page can redraw a chart placeholder
+after every batch instead of waiting for the whole result. Completed results go
+into a small TTL cache, because ``st.cache_data`` cannot hold a value that was
+rendered while it was still being produced; a rerun over the same range then
+renders at once.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+import pandas as pd
+import streamlit as st
+
+RESULT_TTL = 3600
+MAX_RESULTS = 8
+
+
+@st.cache_resource
+def _results():
+    return OrderedDict(), threading.Lock()
+
+
+def cached_result(key):
+    """The completed result stored under ``key``, or None if absent or expired."""
+    results, lock = _results()
+    with lock:
+        entry = results.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            results.pop(key, None)
+            return None
+        results.move_to_end(key)
+        return entry[1]
+
+
+def store_result(key, df):
+    results, lock = _results()
+    with lock:
+        results[key] = (time.monotonic() + RESULT_TTL, df)
+        results.move_to_end(key)
+        while len(results) > MAX_RESULTS:
+            results.popitem(last=False)
+
+
+def accumulate(batches):
+    """Yield the concatenation of all batches received so far, after each batch."""
+    frames = []
+    for batch in batches:
+        if batch.empty:
+            continue
+        frames.append(batch)
+        yield pd.concat(frames, ignore_index=True)
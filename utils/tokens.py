@@ -0,0 +1,102 @@
+"""Token metadata keyed on the raw asset ids found in fact_transfers / fact_gmp.
+
+``TOKENS`` maps each raw asset (an Axelar denom such as ``uusdc`` or
+``eth-wei``) to its canonical symbol, decimals and origin chain. Raw assets
+that are not listed keep their own name as symbol, which is already the case
+for GMP rows (``data:symbol``). ``TOKEN_PREFIXES`` covers denom families that
+share one symbol.
+"""
+
+# -- raw asset: (symbol, decimals, origin chain)
+TOKENS = {
+    "arb-wei": ("ARB", 18, "arbitrum"),
+    "avalanche-uusdc": ("Avalanche USDC", 6, "avalanche"),
+    "avax-wei": ("AVAX", 18, "avalanche"),
+    "bnb-wei": ("BNB", 18, "binance"),
+    "busd-wei": ("BUSD", 18, "binance"),
+    "cbeth-wei": ("cbETH", 18, "ethereum"),
+    "cusd-wei": ("cUSD", 18, "celo"),
+    "dai-wei": ("DAI", 18, "ethereum"),
+    "dot-planck": ("DOT", 10, "polkadot"),
+    "eeur": ("EURC", 6, "e-money"),
+    "ern-wei": ("ERN", 18, "ethereum"),
+    "eth-wei": ("ETH", 18, "ethereum"),
+    "fil-wei": ("FIL", 18, "filecoin"),
+    "frax-wei": ("FRAX", 18, "ethereum"),
+    "ftm-wei": ("FTM", 18, "fantom"),
+    "glmr-wei": ("GLMR", 18, "moonbeam"),
+    "hzn-wei": ("HZN", 18, "ethereum"),
+    "link-wei": ("LINK", 18, "ethereum"),
+    "matic-wei": ("MATIC", 18, "polygon"),
+    "mkr-wei": ("MKR", 18, "ethereum"),
+    "mpx-wei": ("MPX", 18, "fantom"),
+    "oath-wei": ("OATH", 18, "ethereum"),
+    "op-wei": ("OP", 18, "optimism"),
+    "orbs-wei": ("ORBS", 18, "ethereum"),
+    "factory/sei10hud5e5er4aul2l7sp2u9qp2lag5u4xf8mvyx38cnjvqhlgsrcls5qn5ke/seilor": ("SEILOR", 6, "sei"),
+    "pepe-wei": ("PEPE", 18, "ethereum"),
+    "polygon-uusdc": ("Polygon USDC", 6, "polygon"),
+    "reth-wei": ("rETH", 18, "ethereum"),
+    "ring-wei": ("RING", 18, "ethereum"),
+    "shib-wei": ("SHIB", 18, "ethereum"),
+    "sonne-wei": ("SONNE", 18, "optimism"),
+    "stuatom": ("stATOM", 6, "stride"),
+    "uatom": ("ATOM", 6, "cosmoshub"),
+    "uaxl": ("AXL", 6, "axelarnet"),
+    "ukuji": ("KUJI", 6, "kujira"),
+    "ulava": ("LAVA", 6, "lava"),
+    "uluna": ("LUNA", 6, "terra-2"),
+    "ungm": ("NGM", 6, "e-money"),
+    "uni-wei": ("UNI", 18, "ethereum"),
+    "uosmo": ("OSMO", 6, "osmosis"),
+    "usomm": ("SOMM", 6, "sommelier"),
+    "ustrd": ("STRD", 6, "stride"),
+    "utia": ("TIA", 6, "celestia"),
+    "uumee": ("UMEE", 6, "umee"),
+    "uusd": ("USTC", 6, "terra"),
+    "uusdc": ("USDC", 6, "ethereum"),
+    "uusdt": ("USDT", 6, "ethereum"),
+    "vela-wei": ("VELA", 18, "arbitrum"),
+    "wavax-wei": ("WAVAX", 18, "avalanche"),
+    "wbnb-wei": ("WBNB", 18, "binance"),
+    "wbtc-satoshi": ("WBTC", 8, "ethereum"),
+    "weth-wei": ("WETH", 18, "ethereum"),
+    "wfil-wei": ("WFIL", 18, "filecoin"),
+    "wftm-wei": ("WFTM", 18, "fantom"),
+    "wglmr-wei": ("WGLMR", 18, "moonbeam"),
+    "wmai-wei": ("WMAI", 18, "polygon"),
+    "wmatic-wei": ("WMATIC", 18, "polygon"),
+    "wsteth-wei": ("wstETH", 18, "ethereum"),
+    "yield-eth-wei": ("yieldETH", 18, "ethereum"),
+}
+# -- Raw-asset prefix: symbol, for denom families (case-insensitive, like ILIKE 'prefix%')
+TOKEN_PREFIXES = {
+    "factory/sei10hub": "SEILOR",
+}
+
+
+def token_metadata_sql():
+    """``TOKENS`` as a SQL ``(raw_asset, symbol, decimals, chain)`` relation for an equality join."""
+    rows = ",\n".join(
+        f"('{raw_asset}', '{symbol}', {decimals}, '{chain}')"
+        for raw_asset, (symbol, decimals, chain) in TOKENS.items()
+    )
+    return f"select * from (values\n{rows}\n) as token_metadata(raw_asset, symbol, decimals, chain)"
+
+
+def symbol_sql(raw_asset, symbol):
+    """SQL expression for the canonical symbol, given the raw asset and the joined ``symbol`` columns."""
+    prefixes = " ".join(
+        f"WHEN {raw_asset} ILIKE '{prefix}%' THEN '{prefix_symbol}'"
+        for prefix, prefix_symbol in TOKEN_PREFIXES.items()
+    )
+    return f"COALESCE({symbol}, CASE {prefixes} ELSE {raw_asset} END)"
+
+
+def symbols(raw_assets):
+    """Canonical symbol for each raw asset in the ``raw_assets`` Series, matching ``symbol_sql``."""
+    mapped = raw_assets.map({raw_asset: symbol for raw_asset, (symbol, _, _) in TOKENS.items()})
+    lowered = raw_assets.str.lower()
+    for prefix, prefix_symbol in TOKEN_PREFIXES.items():
+        mapped = mapped.where(mapped.notna() | ~lowered.str.startswith(prefix.lower(), na=False), prefix_symbol)
+    return mapped.fillna(raw_assets)